@@ -28,6 +28,8 @@ export async function runAnalysis(options: AnalyzeOptions): Promise<AnalysisResu
     config.aiModelSize,
     "--model-dir",
     paths.aiModelDir,
+    "--whisper-backend",
+    config.aiWhisperBackend,
     "--ffmpeg-bin",
     config.ffmpegBin,
     "--ffprobe-bin",
@@ -37,6 +37,7 @@ export const config = {
     process.env.PYTHON_PATH ?? "services/ai/.venv/Scripts/python.exe",
   aiModelSize: process.env.AI_MODEL_SIZE ?? "base.en",
   aiModelDir: process.env.AI_MODEL_DIR ?? "services/ai/models",
+  aiWhisperBackend: process.env.AI_WHISPER_BACKEND ?? "faster",
   corsOrigins: (process.env.CORS_ORIGIN ?? `http://${process.env.APP_HOST ?? "127.0.0.1"}:${process.env.WEB_PORT ?? "5173"}`)
     .split(",")
     .map((origin) => origin.trim())
@@ -48,6 +48,8 @@ async function checkModelAvailability(): Promise<Check> {
       config.aiModelSize,
       "--model-dir",
       paths.aiModelDir,
+      "--whisper-backend",
+      config.aiWhisperBackend,
       "--check-only"
     ], {
       cwd: paths.aiRoot
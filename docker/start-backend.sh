@@ -4,12 +4,21 @@ set -euo pipefail
 PYTHON_BIN="${PYTHON_PATH:-/app/services/ai/.venv/bin/python}"
 MODEL_NAME="${AI_MODEL_SIZE:-base.en}"
 MODEL_DIR="${AI_MODEL_DIR:-/var/data/models}"
+WHISPER_BACKEND="${AI_WHISPER_BACKEND:-faster}"
 
 mkdir -p "${MODEL_DIR}"
 
 if [[ "${SKIP_MODEL_DOWNLOAD:-0}" != "1" ]]; then
   pushd /app/services/ai >/dev/null
-  "${PYTHON_BIN}" -m ai_worker.download_model --model "${MODEL_NAME}" --model-dir "${MODEL_DIR}"
+  "${PYTHON_BIN}" -m ai_worker.download_model --model "${MODEL_NAME}" --model-dir "${MODEL_DIR}" --whisper-backend "${WHISPER_BACKEND}"
+  popd >/dev/null
+fi
+
+if [[ -n "${AI_WORKER_ADDRESS:-}" && -z "${AI_WORKER_AUTHKEY:-}" ]]; then
+  echo "AI_WORKER_ADDRESS is set but AI_WORKER_AUTHKEY is not; not starting the AI worker" >&2
+elif [[ -n "${AI_WORKER_ADDRESS:-}" ]]; then
+  pushd /app/services/ai >/dev/null
+  "${PYTHON_BIN}" -m ai_worker.server --address "${AI_WORKER_ADDRESS}" --model "${MODEL_NAME}" --model-dir "${MODEL_DIR}" --whisper-backend "${WHISPER_BACKEND}" &
   popd >/dev/null
 fi
 
@@ -1,16 +1,57 @@
 from __future__ import annotations
 
 import argparse
-import json
+import multiprocessing
 import os
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+from pathlib import Path
 from typing import Any
 
-from faster_whisper import WhisperModel
+import numpy as np
+import orjson
 
+from .audio import SAMPLE_RATE, decode_audio, pcm_to_float, voiced_duration_sec
 from .scene import detect_scene_cuts
 from .silence import detect_silence_regions
+from .whispercpp import MISSING_BINDING_MESSAGE, fetch_model
+
+WHISPER_BACKENDS = ("faster", "whispercpp")
+CHUNK_TARGET_SEC = 30.0
+CHUNK_MIN_SILENCE_SEC = 0.5
+MIN_VOICED_SEC = 0.5
+
+_chunk_model: Any = None
+
+
+class AnalysisError(RuntimeError):
+    pass
+
+
+def add_speech_model_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--model", default="base.en", help="Whisper model name")
+    parser.add_argument("--model-dir", required=True, help="Whisper model cache directory")
+    parser.add_argument(
+        "--whisper-backend",
+        choices=WHISPER_BACKENDS,
+        default="faster",
+        help="Speech recognition backend",
+    )
+    parser.add_argument(
+        "--cpu-threads",
+        type=int,
+        default=int(os.environ.get("AI_WHISPER_CPU_THREADS", "0")),
+        help="Threads for the Whisper model; 0 uses all cores but two",
+    )
+    parser.add_argument(
+        "--whisper-workers",
+        type=int,
+        default=int(os.environ.get("AI_WHISPER_WORKERS", "1")),
+        help="Transcribe silence-aligned audio chunks across this many processes (faster backend only)",
+    )
 
 
 def parse_args() -> argparse.Namespace:
@@ -18,13 +59,29 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--video", required=True, help="Input video path")
     parser.add_argument("--work-dir", required=True, help="Working directory")
     parser.add_argument("--out", required=True, help="Output JSON path")
-    parser.add_argument("--model", default="base.en", help="Whisper model name")
-    parser.add_argument("--model-dir", required=True, help="Whisper model cache directory")
+    add_speech_model_args(parser)
     parser.add_argument("--ffmpeg-bin", default="ffmpeg", help="Path to ffmpeg")
     parser.add_argument("--ffprobe-bin", default="ffprobe", help="Path to ffprobe")
+    parser.add_argument(
+        "--worker-address",
+        default=os.environ.get("AI_WORKER_ADDRESS", ""),
+        help="host:port of a running ai_worker.server; analysis runs in-process when unset or unreachable",
+    )
     return parser.parse_args()
 
 
+def parse_worker_address(address: str) -> tuple[str, int]:
+    host, _sep, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def worker_authkey() -> bytes | None:
+    # multiprocessing.connection unpickles what it receives, so the shared key is the only thing
+    # standing between the socket and code execution: there is deliberately no default.
+    key = os.environ.get("AI_WORKER_AUTHKEY", "")
+    return key.encode("utf-8") if key else None
+
+
 def probe_duration(video_path: str, ffprobe_bin: str) -> float:
     cmd = [
         ffprobe_bin,
@@ -45,69 +102,263 @@ def probe_duration(video_path: str, ffprobe_bin: str) -> float:
     return duration
 
 
-def overlap_len(start_a: float, end_a: float, start_b: float, end_b: float) -> float:
-    start = max(start_a, start_b)
-    end = min(end_a, end_b)
-    return max(0.0, end - start)
+def speech_overlap_sums(
+    interval_starts: np.ndarray,
+    interval_ends: np.ndarray,
+    speech_regions: list[dict[str, Any]],
+) -> np.ndarray:
+    sums = np.zeros(interval_starts.size, dtype=np.float64)
+    if not speech_regions:
+        return sums
+
+    speech_sorted = sorted(speech_regions, key=lambda item: item["startSec"])
+    starts = np.array([item["startSec"] for item in speech_sorted], dtype=np.float64)
+    ends = np.array([item["endSec"] for item in speech_sorted], dtype=np.float64)
+    # Running max keeps the end array monotonic even if speech spans overlap each other.
+    max_ends = np.maximum.accumulate(ends)
+
+    los = np.searchsorted(max_ends, interval_starts, side="right")
+    his = np.searchsorted(starts, interval_ends, side="left")
+    for idx, (lo, hi) in enumerate(zip(los.tolist(), his.tolist())):
+        if hi <= lo:
+            continue
+        start = interval_starts[idx]
+        end = interval_ends[idx]
+        overlap = np.minimum(end, ends[lo:hi]) - np.maximum(start, starts[lo:hi])
+        sums[idx] = np.maximum(0.0, overlap).sum()
+    return sums
+
+
+def whisper_cpu_threads(requested: int = 0) -> int:
+    if requested > 0:
+        return requested
+    # Leave headroom for the ffmpeg silence/scene passes running alongside transcription.
+    return max(1, (os.cpu_count() or 1) - 2)
+
+
+def speech_region(start_sec: float, end_sec: float, text: str, avg_logprob: float) -> dict[str, Any]:
+    confidence = 1.0 + avg_logprob / 5.0
+    return {
+        "startSec": start_sec,
+        "endSec": end_sec,
+        "text": text.strip(),
+        "confidence": 0.0 if confidence < 0.0 else (1.0 if confidence > 1.0 else confidence),
+    }
 
 
-def detect_speech_regions(video_path: str, model_name: str, model_dir: str) -> list[dict[str, Any]]:
-    model = WhisperModel(
+def load_speech_model(
+    model_name: str,
+    model_dir: str,
+    backend: str = "faster",
+    cpu_threads: int = 0,
+) -> Any:
+    if backend == "whispercpp":
+        try:
+            from pywhispercpp.model import Model
+        except ImportError as exc:
+            raise RuntimeError(MISSING_BINDING_MESSAGE) from exc
+
+        return Model(
+            fetch_model(model_name, model_dir, local_files_only=True),
+            n_threads=whisper_cpu_threads(cpu_threads),
+            print_progress=False,
+            print_realtime=False,
+        )
+
+    from faster_whisper import WhisperModel
+
+    return WhisperModel(
         model_name,
         device="cpu",
         compute_type="int8",
+        cpu_threads=whisper_cpu_threads(cpu_threads),
+        num_workers=1,
         download_root=model_dir,
     )
+
+
+def transcribe_whispercpp(model: Any, audio: str | np.ndarray) -> list[dict[str, Any]]:
+    segments = model.transcribe(audio, language="en")
+
+    results: list[dict[str, Any]] = []
+    for segment in segments:
+        # whisper.cpp reports t0/t1 in centiseconds and exposes no per-segment log-probability.
+        start_sec = segment.t0 / 100.0
+        end_sec = segment.t1 / 100.0
+        if end_sec <= start_sec:
+            continue
+        results.append(speech_region(start_sec, end_sec, str(segment.text), -1.0))
+
+    return sorted(results, key=lambda item: (item["startSec"], item["endSec"]))
+
+
+def transcribe_faster(model: Any, audio: str | np.ndarray, offset_sec: float = 0.0) -> list[dict[str, Any]]:
     segments, _info = model.transcribe(
-        video_path,
+        audio,
         language="en",
         vad_filter=True,
         beam_size=1,
         temperature=0.0,
+        # Each segment is decoded independently, which also keeps parallel chunks consistent.
+        condition_on_previous_text=False,
     )
 
-    results: list[dict[str, Any]] = []
-    for segment in segments:
-        start_sec = float(segment.start)
-        end_sec = float(segment.end)
-        if end_sec <= start_sec:
-            continue
-        avg_logprob = float(getattr(segment, "avg_logprob", -1.0))
-        confidence = max(0.0, min(1.0, 1.0 + avg_logprob / 5.0))
-        results.append(
-            {
-                "startSec": round(start_sec, 3),
-                "endSec": round(end_sec, 3),
-                "text": str(segment.text).strip(),
-                "confidence": round(confidence, 3),
-            }
+    # faster-whisper segments are plain dataclasses with float fields and avg_logprob always set.
+    return [
+        speech_region(
+            segment.start + offset_sec,
+            segment.end + offset_sec,
+            segment.text,
+            segment.avg_logprob,
         )
+        for segment in segments
+        if segment.end > segment.start
+    ]
+
+
+def split_audio_on_silence(
+    audio: np.ndarray,
+    silence_regions: list[dict[str, float]],
+) -> list[tuple[np.ndarray, float]]:
+    boundaries = [0]
+    for silence in sorted(silence_regions, key=lambda item: item["startSec"]):
+        if silence["endSec"] - silence["startSec"] <= CHUNK_MIN_SILENCE_SEC:
+            continue
+        split_sec = (silence["startSec"] + silence["endSec"]) / 2.0
+        split_idx = min(len(audio), int(split_sec * SAMPLE_RATE))
+        if split_idx - boundaries[-1] >= CHUNK_TARGET_SEC * SAMPLE_RATE:
+            boundaries.append(split_idx)
+    if boundaries[-1] < len(audio):
+        boundaries.append(len(audio))
+
+    return [
+        (audio[start:end], start / SAMPLE_RATE)
+        for start, end in zip(boundaries, boundaries[1:])
+    ]
+
+
+def _init_chunk_worker(model_name: str, model_dir: str, cpu_threads: int) -> None:
+    from faster_whisper import WhisperModel
+
+    global _chunk_model
+    _chunk_model = WhisperModel(
+        model_name,
+        device="cpu",
+        compute_type="int8",
+        cpu_threads=cpu_threads,
+        num_workers=1,
+        download_root=model_dir,
+    )
+
+
+def _transcribe_chunk(chunk: tuple[np.ndarray, float]) -> list[dict[str, Any]]:
+    audio, offset_sec = chunk
+    return transcribe_faster(_chunk_model, audio, offset_sec)
+
+
+def create_chunk_pool(
+    model_name: str,
+    model_dir: str,
+    workers: int,
+    cpu_threads: int = 0,
+) -> ProcessPoolExecutor:
+    # The chunk processes split the --cpu-threads budget rather than each taking all of it.
+    threads_per_worker = max(1, whisper_cpu_threads(cpu_threads) // workers)
+    # spawn, not fork: the pool is created from a worker thread while ffmpeg feeder threads run,
+    # and in server mode after ctranslate2/OpenMP is loaded, both of which can deadlock a fork.
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_chunk_worker,
+        initargs=(model_name, model_dir, threads_per_worker),
+    )
 
+
+def transcribe_chunks(
+    chunks: list[tuple[np.ndarray, float]],
+    model_name: str,
+    model_dir: str,
+    workers: int,
+    pool: ProcessPoolExecutor | None = None,
+    cpu_threads: int = 0,
+) -> list[dict[str, Any]]:
+    if pool is not None:
+        return [region for regions in pool.map(_transcribe_chunk, chunks) for region in regions]
+    with create_chunk_pool(model_name, model_dir, min(workers, len(chunks)), cpu_threads) as pool:
+        return [region for regions in pool.map(_transcribe_chunk, chunks) for region in regions]
+
+
+def detect_speech_regions(
+    audio: str | np.ndarray,
+    model_name: str,
+    model_dir: str,
+    backend: str = "faster",
+    model: Any = None,
+    workers: int = 1,
+    silence_regions: list[dict[str, float]] | None = None,
+    cpu_threads: int = 0,
+    chunk_pool: ProcessPoolExecutor | None = None,
+) -> list[dict[str, Any]]:
+    if backend == "faster" and workers > 1 and silence_regions and isinstance(audio, np.ndarray):
+        chunks = split_audio_on_silence(audio, silence_regions)
+        if len(chunks) > 1:
+            results = transcribe_chunks(chunks, model_name, model_dir, workers, chunk_pool, cpu_threads)
+            return sorted(results, key=lambda item: (item["startSec"], item["endSec"]))
+
+    if model is None:
+        model = load_speech_model(model_name, model_dir, backend, cpu_threads)
+    if backend == "whispercpp":
+        return transcribe_whispercpp(model, audio)
+
+    results = transcribe_faster(model, audio)
     return sorted(results, key=lambda item: (item["startSec"], item["endSec"]))
 
 
+def round_fields(regions: list[dict[str, Any]], fields: tuple[str, ...]) -> list[dict[str, Any]]:
+    if not regions:
+        return regions
+    values = np.array([[region[field] for field in fields] for region in regions], dtype=np.float64)
+    table = np.round(values, 3)
+    for region, row in zip(regions, table.tolist()):
+        region.update(zip(fields, row))
+    return regions
+
+
+def merge_candidates(starts: np.ndarray, ends: np.ndarray, scores: np.ndarray) -> list[dict[str, float]]:
+    if starts.size == 0:
+        return []
+
+    order = np.argsort(starts, kind="stable")
+    starts, ends, scores = starts[order], ends[order], scores[order]
+    # A candidate opens a new group when it starts after every earlier candidate has ended.
+    max_end = np.maximum.accumulate(ends)
+    group_starts = np.flatnonzero(np.concatenate(([True], starts[1:] > max_end[:-1])))
+
+    merged_starts = starts[group_starts]
+    merged_ends = np.maximum.reduceat(ends, group_starts)
+    merged_scores = np.maximum.reduceat(scores, group_starts)
+    return [
+        {"startSec": start, "endSec": end, "score": score}
+        for start, end, score in zip(
+            merged_starts.tolist(),
+            merged_ends.tolist(),
+            merged_scores.tolist(),
+        )
+    ]
+
+
 def build_low_info_regions(
     duration_sec: float,
     silence_regions: list[dict[str, float]],
     scene_cuts_sec: list[float],
     speech_regions: list[dict[str, Any]],
 ) -> list[dict[str, float]]:
-    candidates: list[dict[str, float]] = []
-
-    for silence in silence_regions:
-        start = silence["startSec"]
-        end = silence["endSec"]
-        length = max(0.0, end - start)
-        if length < 0.4:
-            continue
-        score = min(1.0, 0.55 + min(0.35, length / 8.0))
-        candidates.append(
-            {
-                "startSec": round(start, 3),
-                "endSec": round(end, 3),
-                "score": round(score, 3),
-            }
-        )
+    silence_starts = np.array([item["startSec"] for item in silence_regions], dtype=np.float64)
+    silence_ends = np.array([item["endSec"] for item in silence_regions], dtype=np.float64)
+    silence_lengths = np.maximum(0.0, silence_ends - silence_starts)
+    silence_keep = silence_lengths >= 0.4
+    silence_lengths = silence_lengths[silence_keep]
+    silence_scores = np.minimum(1.0, 0.55 + np.minimum(0.35, silence_lengths / 8.0))
 
     cuts = sorted({max(0.0, min(duration_sec, value)) for value in scene_cuts_sec})
     if not cuts or cuts[0] > 0:
@@ -115,100 +366,196 @@ def build_low_info_regions(
     if cuts[-1] < duration_sec:
         cuts.append(duration_sec)
 
-    for idx in range(len(cuts) - 1):
-        start = cuts[idx]
-        end = cuts[idx + 1]
-        length = max(0.0, end - start)
-        if length < 0.8:
-            continue
-
-        speech_overlap = 0.0
-        for speech in speech_regions:
-            speech_overlap += overlap_len(start, end, speech["startSec"], speech["endSec"])
-        speech_coverage = speech_overlap / length
-
-        if speech_coverage > 0.2:
-            continue
-
-        score = min(1.0, 0.4 + (1.0 - speech_coverage) * 0.45 + min(0.15, length / 12.0))
-        candidates.append(
-            {
-                "startSec": round(start, 3),
-                "endSec": round(end, 3),
-                "score": round(score, 3),
-            }
-        )
-
-    if not candidates:
-        return []
-
-    candidates.sort(key=lambda item: (item["startSec"], item["endSec"]))
-    merged: list[dict[str, float]] = [candidates[0]]
-    for current in candidates[1:]:
-        last = merged[-1]
-        if current["startSec"] <= last["endSec"]:
-            merged[-1] = {
-                "startSec": last["startSec"],
-                "endSec": max(last["endSec"], current["endSec"]),
-                "score": round(max(last["score"], current["score"]), 3),
-            }
-        else:
-            merged.append(current)
-
-    return merged
+    cut_points = np.array(cuts, dtype=np.float64)
+    interval_starts = cut_points[:-1]
+    interval_ends = cut_points[1:]
+    lengths = np.maximum(0.0, interval_ends - interval_starts)
+    overlaps = speech_overlap_sums(interval_starts, interval_ends, speech_regions)
+    coverage = np.divide(overlaps, lengths, out=np.zeros_like(lengths), where=lengths > 0)
+
+    interval_keep = (lengths >= 0.8) & (coverage <= 0.2)
+    lengths = lengths[interval_keep]
+    coverage = coverage[interval_keep]
+    interval_scores = np.minimum(1.0, 0.4 + (1.0 - coverage) * 0.45 + np.minimum(0.15, lengths / 12.0))
+
+    return merge_candidates(
+        np.concatenate((silence_starts[silence_keep], interval_starts[interval_keep])),
+        np.concatenate((silence_ends[silence_keep], interval_ends[interval_keep])),
+        np.concatenate((silence_scores, interval_scores)),
+    )
 
 
-def main() -> int:
-    args = parse_args()
-    os.makedirs(args.work_dir, exist_ok=True)
-    os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
-    os.makedirs(args.model_dir, exist_ok=True)
+def run_analysis(
+    video_path: str,
+    work_dir: str,
+    out_path: str,
+    *,
+    model_name: str,
+    model_dir: str,
+    whisper_backend: str = "faster",
+    whisper_workers: int = 1,
+    cpu_threads: int = 0,
+    ffmpeg_bin: str = "ffmpeg",
+    ffprobe_bin: str = "ffprobe",
+    speech_model: Any = None,
+    chunk_pool: ProcessPoolExecutor | None = None,
+) -> None:
+    os.makedirs(work_dir, exist_ok=True)
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    os.makedirs(model_dir, exist_ok=True)
 
     warnings: list[str] = []
 
+    # Decode before starting any background work: a failure here must not wait for the
+    # full-video scene pass to finish before it reaches the caller.
     try:
-        duration_sec = probe_duration(args.video, args.ffprobe_bin)
+        pcm = decode_audio(video_path, ffmpeg_bin=ffmpeg_bin)
     except Exception as exc:  # pragma: no cover - dependency/system issue
-        sys.stderr.write(f"Duration probe failed: {exc}\n")
-        return 1
+        raise AnalysisError(f"Audio decode failed: {exc}") from exc
 
+    executor = ThreadPoolExecutor(max_workers=3)
     try:
-        speech_regions = detect_speech_regions(args.video, args.model, args.model_dir)
-    except Exception as exc:  # pragma: no cover - dependency/system issue
-        sys.stderr.write(f"Speech analysis failed: {exc}\n")
-        return 1
-
-    try:
-        silence_regions = detect_silence_regions(args.video, ffmpeg_bin=args.ffmpeg_bin)
-    except Exception as exc:
-        silence_regions = []
-        warnings.append(f"Silence detection failed: {exc}")
-
-    try:
-        scene_cuts = detect_scene_cuts(args.video)
-    except Exception as exc:
-        scene_cuts = [0.0, round(duration_sec, 3)]
-        warnings.append(f"Scene detection failed: {exc}")
+        scene_future = executor.submit(detect_scene_cuts, video_path, ffmpeg_bin=ffmpeg_bin)
+        silence_future = executor.submit(detect_silence_regions, ffmpeg_bin=ffmpeg_bin, pcm=pcm)
+
+        def transcribe() -> list[dict[str, Any]]:
+            # Chunked transcription splits on silences, so it has to wait for silencedetect.
+            chunk_silences = None
+            if whisper_workers > 1 and silence_future.exception() is None:
+                chunk_silences = silence_future.result()
+            return detect_speech_regions(
+                pcm_to_float(pcm),
+                model_name,
+                model_dir,
+                backend=whisper_backend,
+                model=speech_model,
+                workers=whisper_workers,
+                silence_regions=chunk_silences,
+                cpu_threads=cpu_threads,
+                chunk_pool=chunk_pool,
+            )
+
+        voiced_sec = voiced_duration_sec(pcm)
+        if voiced_sec < MIN_VOICED_SEC:
+            speech_regions = []
+            warnings.append(
+                f"Audio has only {voiced_sec:.2f}s above speech level; skipped speech transcription"
+            )
+        else:
+            try:
+                speech_regions = executor.submit(transcribe).result()
+            except Exception as exc:  # pragma: no cover - dependency/system issue
+                raise AnalysisError(f"Speech analysis failed: {exc}") from exc
+
+        try:
+            silence_regions = silence_future.result()
+        except Exception as exc:
+            silence_regions = []
+            warnings.append(f"Silence detection failed: {exc}")
+
+        try:
+            scene_cuts, duration_sec = scene_future.result()
+        except Exception as exc:
+            scene_cuts = []
+            duration_sec = 0.0
+            warnings.append(f"Scene detection failed: {exc}")
+    except BaseException:
+        # Report failures right away; the executor's normal shutdown would first wait for the
+        # full-video scene pass to finish.
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+
+    # The scene pass already parsed the container header; only fall back to ffprobe when it could
+    # not report a duration.
+    if duration_sec <= 0:
+        try:
+            duration_sec = probe_duration(video_path, ffprobe_bin)
+        except Exception as exc:  # pragma: no cover - dependency/system issue
+            raise AnalysisError(f"Duration probe failed: {exc}") from exc
 
     if not scene_cuts:
         scene_cuts = [0.0, round(duration_sec, 3)]
+    elif round(duration_sec, 3) > scene_cuts[-1]:
+        # ffmpeg printed "Duration: N/A", so the scene pass could not close the cut list itself.
+        scene_cuts.append(round(duration_sec, 3))
+    assert scene_cuts == sorted(set(scene_cuts)), "detect_scene_cuts must return sorted unique cuts"
 
     low_info_regions = build_low_info_regions(duration_sec, silence_regions, scene_cuts, speech_regions)
 
+    # Analyzers keep full precision internally; regions are rounded to milliseconds once here.
+    # Scene cuts already arrive rounded and sorted from detect_scene_cuts.
     payload = {
-        "speechRegions": speech_regions,
-        "silenceRegions": silence_regions,
-        "sceneCutsSec": sorted({round(max(0.0, value), 3) for value in scene_cuts}),
-        "lowInfoRegions": low_info_regions,
+        "speechRegions": round_fields(speech_regions, ("startSec", "endSec", "confidence")),
+        "silenceRegions": round_fields(silence_regions, ("startSec", "endSec")),
+        "sceneCutsSec": scene_cuts,
+        "lowInfoRegions": round_fields(low_info_regions, ("startSec", "endSec", "score")),
         "warnings": warnings,
     }
 
-    with open(args.out, "w", encoding="utf-8") as out_file:
-        json.dump(payload, out_file, indent=2)
+    Path(out_path).write_bytes(
+        orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    )
+
+
+def request_remote_analysis(address: str, authkey: bytes, args: argparse.Namespace) -> None:
+    job = {
+        "video": args.video,
+        "work_dir": args.work_dir,
+        "out": args.out,
+        "model": args.model,
+        "whisper_backend": args.whisper_backend,
+        "ffmpeg_bin": args.ffmpeg_bin,
+        "ffprobe_bin": args.ffprobe_bin,
+    }
+    with Client(parse_worker_address(address), authkey=authkey) as conn:
+        conn.send(job)
+        reply = conn.recv()
+    if not reply.get("ok"):
+        raise AnalysisError(reply.get("error") or "AI worker returned no result")
+
+
+def main() -> int:
+    args = parse_args()
+
+    authkey = worker_authkey()
+    if args.worker_address and authkey is None:
+        sys.stderr.write("AI_WORKER_AUTHKEY is not set; ignoring the AI worker and analyzing in-process\n")
+    elif args.worker_address:
+        try:
+            request_remote_analysis(args.worker_address, authkey, args)
+        except AnalysisError as exc:
+            sys.stderr.write(f"{exc}\n")
+            return 1
+        except (OSError, EOFError, AuthenticationError) as exc:
+            # Unreachable, wrong key, or the worker died mid-job: the video can still be analyzed here.
+            sys.stderr.write(
+                f"AI worker at {args.worker_address} unavailable ({exc!r}); analyzing in-process\n"
+            )
+        else:
+            sys.stdout.write(f"Analysis completed for {args.video}\n")
+            return 0
+
+    try:
+        run_analysis(
+            args.video,
+            args.work_dir,
+            args.out,
+            model_name=args.model,
+            model_dir=args.model_dir,
+            whisper_backend=args.whisper_backend,
+            whisper_workers=args.whisper_workers,
+            cpu_threads=args.cpu_threads,
+            ffmpeg_bin=args.ffmpeg_bin,
+            ffprobe_bin=args.ffprobe_bin,
+        )
+    except AnalysisError as exc:
+        sys.stderr.write(f"{exc}\n")
+        return 1
 
     sys.stdout.write(f"Analysis completed for {args.video}\n")
     return 0
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
\ No newline at end of file
+    raise SystemExit(main())
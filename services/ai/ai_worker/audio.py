@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import subprocess
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+QUIET_RMS_LEVEL = 512.0
+RMS_FRAME_SAMPLES = SAMPLE_RATE // 40  # 25 ms
+_RMS_BLOCK_FRAMES = 2400  # one minute of frames per block keeps the float copy small
+
+
+def decode_audio(video_path: str, ffmpeg_bin: str = "ffmpeg") -> np.ndarray:
+    cmd = [
+        ffmpeg_bin,
+        "-hide_banner",
+        "-v",
+        "error",
+        "-i",
+        video_path,
+        "-vn",
+        "-ac",
+        "1",
+        "-ar",
+        str(SAMPLE_RATE),
+        "-f",
+        "s16le",
+        "-",
+    ]
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg audio decode failed: {result.stderr.decode(errors='replace')}")
+    return np.frombuffer(result.stdout, dtype=np.int16)
+
+
+def pcm_to_float(pcm: np.ndarray) -> np.ndarray:
+    return pcm.astype(np.float32) / 32768.0
+
+
+def voiced_duration_sec(pcm: np.ndarray) -> float:
+    # Per-frame RMS rather than per-sample amplitude: speech crosses zero constantly, so counting
+    # quiet samples would call even a narrated track mostly silent.
+    frame_count = pcm.size // RMS_FRAME_SAMPLES
+    frames = pcm[: frame_count * RMS_FRAME_SAMPLES].reshape(frame_count, RMS_FRAME_SAMPLES)
+    loud_frames = 0
+    for start in range(0, frame_count, _RMS_BLOCK_FRAMES):
+        block = frames[start : start + _RMS_BLOCK_FRAMES].astype(np.float32)
+        rms = np.sqrt(np.mean(block * block, axis=1))
+        loud_frames += int(np.count_nonzero(rms >= QUIET_RMS_LEVEL))
+    return loud_frames * RMS_FRAME_SAMPLES / SAMPLE_RATE
@@ -3,14 +3,27 @@ from __future__ import annotations
 import argparse
 import os
 import sys
+from pathlib import Path
 
-from faster_whisper import WhisperModel
+from .whispercpp import (
+    MISSING_BINDING_MESSAGE,
+    WHISPERCPP_REPO,
+    binding_available,
+    fetch_model,
+    model_filename,
+)
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Download/check faster-whisper model cache")
     parser.add_argument("--model", default="base.en", help="Model name")
     parser.add_argument("--model-dir", required=True, help="Directory for model cache")
+    parser.add_argument(
+        "--whisper-backend",
+        choices=("faster", "whispercpp"),
+        default="faster",
+        help="Speech recognition backend whose model should be fetched",
+    )
     parser.add_argument(
         "--check-only",
         action="store_true",
@@ -19,18 +32,41 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _cached(model: str, model_dir: str, backend: str) -> bool:
+    # Mirrors the huggingface_hub cache layout: <model_dir>/models--<org>--<repo>/snapshots/<rev>/<file>.
+    if backend == "whispercpp":
+        repo_dir = "models--" + WHISPERCPP_REPO.replace("/", "--")
+        return any(Path(model_dir).glob(f"{repo_dir}/snapshots/*/{model_filename(model)}"))
+    if os.path.isfile(os.path.join(model, "model.bin")):
+        return True
+    return any(Path(model_dir).glob(f"models--*--faster-whisper-{model}/snapshots/*/model.bin"))
+
+
 def main() -> int:
     args = parse_args()
     os.makedirs(args.model_dir, exist_ok=True)
 
+    if args.whisper_backend == "whispercpp" and not binding_available():
+        sys.stderr.write(f"{MISSING_BINDING_MESSAGE}\n")
+        return 1
+
+    if args.check_only and _cached(args.model, args.model_dir, args.whisper_backend):
+        sys.stdout.write(f"Model {args.model} is available in {args.model_dir}\n")
+        return 0
+
     try:
-        WhisperModel(
-            args.model,
-            device="cpu",
-            compute_type="int8",
-            download_root=args.model_dir,
-            local_files_only=args.check_only,
-        )
+        if args.whisper_backend == "whispercpp":
+            fetch_model(args.model, args.model_dir, local_files_only=args.check_only)
+        else:
+            from faster_whisper import WhisperModel
+
+            WhisperModel(
+                args.model,
+                device="cpu",
+                compute_type="int8",
+                download_root=args.model_dir,
+                local_files_only=args.check_only,
+            )
     except Exception as exc:  # pragma: no cover - runtime dependency failure
         sys.stderr.write(f"Model check/download failed: {exc}\n")
         return 1
@@ -1,25 +1,56 @@
 from __future__ import annotations
 
-from typing import Any
+import re
+import subprocess
 
-from scenedetect import SceneManager, open_video
-from scenedetect.detectors import ContentDetector
+_PTS_TIME_RE = re.compile(r"pts_time:\s*([0-9.]+)")
+_DURATION_RE = re.compile(r"Duration:\s*(\d+):(\d+):([0-9.]+)")
 
 
-def detect_scene_cuts(video_path: str) -> list[float]:
-    video = open_video(video_path)
-    manager = SceneManager()
-    manager.add_detector(ContentDetector())
-    manager.detect_scenes(video=video, show_progress=False)
-    scenes = manager.get_scene_list()
+def detect_scene_cuts(
+    video_path: str,
+    ffmpeg_bin: str = "ffmpeg",
+    threshold: float = 0.3,
+) -> tuple[list[float], float]:
+    cmd = [
+        ffmpeg_bin,
+        "-hide_banner",
+        "-nostats",
+        "-i",
+        video_path,
+        "-an",
+        "-sn",
+        "-dn",
+        "-vf",
+        f"select='gt(scene,{threshold})',metadata=print",
+        "-f",
+        "null",
+        "-",
+    ]
+    process = subprocess.run(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+        check=False,
+    )
+    output = process.stderr or ""
+    if process.returncode != 0:
+        raise RuntimeError(f"ffmpeg scene detection failed: {output.strip()[-500:]}")
 
-    if not scenes:
-        return [0.0]
+    duration_sec = 0.0
+    duration_match = _DURATION_RE.search(output)
+    if duration_match:
+        hours, minutes, seconds = duration_match.groups()
+        duration_sec = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
 
     cuts: list[float] = [0.0]
-    for start_tc, _end_tc in scenes:
-        cuts.append(round(start_tc.get_seconds(), 3))
+    for match in _PTS_TIME_RE.finditer(output):
+        cuts.append(float(match.group(1)))
+    if duration_sec > 0:
+        cuts.append(duration_sec)
 
-    last_end = scenes[-1][1].get_seconds()
-    cuts.append(round(last_end, 3))
-    return sorted({max(0.0, value) for value in cuts})
\ No newline at end of file
+    # Canonical form: non-negative, rounded to milliseconds, deduplicated and sorted; callers use
+    # the list as-is.
+    return sorted({round(max(0.0, value), 3) for value in cuts}), duration_sec
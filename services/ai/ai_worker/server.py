@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener
+from typing import Any
+
+from .analyze import (
+    AnalysisError,
+    add_speech_model_args,
+    create_chunk_pool,
+    load_speech_model,
+    parse_worker_address,
+    run_analysis,
+    worker_authkey,
+)
+
+JOB_FIELDS = ("video", "work_dir", "out", "model", "whisper_backend", "ffmpeg_bin", "ffprobe_bin")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve analysis jobs with a preloaded Whisper model.")
+    parser.add_argument(
+        "--address",
+        default=os.environ.get("AI_WORKER_ADDRESS") or "127.0.0.1:7071",
+        help="host:port to listen on",
+    )
+    add_speech_model_args(parser)
+    return parser.parse_args()
+
+
+def handle_job(
+    args: argparse.Namespace,
+    speech_model: Any,
+    chunk_pool: ProcessPoolExecutor | None,
+    job: Any,
+) -> dict[str, Any]:
+    if not isinstance(job, dict):
+        return {"ok": False, "error": f"Malformed job: expected a dict, got {type(job).__name__}"}
+    missing = [field for field in JOB_FIELDS if not isinstance(job.get(field), str)]
+    if missing:
+        return {"ok": False, "error": f"Malformed job: missing {', '.join(missing)}"}
+
+    # The model is loaded once at startup, so a client asking for anything else must be told
+    # rather than silently served with different weights.
+    if job.get("model") != args.model or job.get("whisper_backend") != args.whisper_backend:
+        return {
+            "ok": False,
+            "error": (
+                f"AI worker serves {args.whisper_backend}/{args.model}, but the job requested "
+                f"{job.get('whisper_backend')}/{job.get('model')}"
+            ),
+        }
+
+    try:
+        run_analysis(
+            job["video"],
+            job["work_dir"],
+            job["out"],
+            model_name=args.model,
+            model_dir=args.model_dir,
+            whisper_backend=args.whisper_backend,
+            whisper_workers=args.whisper_workers,
+            cpu_threads=args.cpu_threads,
+            ffmpeg_bin=job["ffmpeg_bin"],
+            ffprobe_bin=job["ffprobe_bin"],
+            speech_model=speech_model,
+            chunk_pool=chunk_pool,
+        )
+    except AnalysisError as exc:
+        return {"ok": False, "error": str(exc)}
+    except Exception as exc:  # pragma: no cover - keep the worker alive on unexpected failures
+        return {"ok": False, "error": f"Analysis failed: {exc}"}
+    return {"ok": True}
+
+
+def ensure_chunk_pool(args: argparse.Namespace, pool: ProcessPoolExecutor) -> ProcessPoolExecutor:
+    # A chunk worker that crashed (e.g. OOM) breaks the whole pool; rebuild it so later jobs run.
+    try:
+        pool.submit(int).result()
+    except BrokenProcessPool:
+        sys.stderr.write("Chunk worker pool broke; restarting it\n")
+        pool.shutdown(wait=False, cancel_futures=True)
+        return create_chunk_pool(args.model, args.model_dir, args.whisper_workers, args.cpu_threads)
+    return pool
+
+
+def main() -> int:
+    args = parse_args()
+    authkey = worker_authkey()
+    if authkey is None:
+        sys.stderr.write("AI_WORKER_AUTHKEY must be set to a secret shared with the API\n")
+        return 1
+    os.makedirs(args.model_dir, exist_ok=True)
+
+    try:
+        speech_model = load_speech_model(
+            args.model,
+            args.model_dir,
+            args.whisper_backend,
+            args.cpu_threads,
+        )
+    except Exception as exc:  # pragma: no cover - runtime dependency failure
+        sys.stderr.write(f"Model load failed: {exc}\n")
+        return 1
+
+    # Chunk workers load their models on first use and then stay alive across jobs, like the main model.
+    chunk_pool = None
+    if args.whisper_backend == "faster" and args.whisper_workers > 1:
+        chunk_pool = create_chunk_pool(args.model, args.model_dir, args.whisper_workers, args.cpu_threads)
+
+    with Listener(parse_worker_address(args.address), authkey=authkey) as listener:
+        sys.stdout.write(f"AI worker listening on {args.address} with model {args.model}\n")
+        sys.stdout.flush()
+        while True:
+            try:
+                conn = listener.accept()
+            except (OSError, EOFError, AuthenticationError) as exc:
+                sys.stderr.write(f"Rejected connection: {exc}\n")
+                continue
+            with conn:
+                try:
+                    job = conn.recv()
+                    conn.send(handle_job(args, speech_model, chunk_pool, job))
+                except (OSError, EOFError) as exc:
+                    sys.stderr.write(f"Job connection dropped: {exc}\n")
+                except Exception as exc:  # pragma: no cover - e.g. an unpicklable message
+                    sys.stderr.write(f"Job failed: {exc}\n")
+            if chunk_pool is not None:
+                chunk_pool = ensure_chunk_pool(args, chunk_pool)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
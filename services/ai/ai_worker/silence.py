@@ -2,23 +2,67 @@ from __future__ import annotations
 
 import re
 import subprocess
-from typing import Any
+import threading
+from collections.abc import Iterator
+from typing import IO, Any
 
-_START_RE = re.compile(r"silence_start:\s*([0-9.]+)")
-_END_RE = re.compile(r"silence_end:\s*([0-9.]+)")
+import numpy as np
+
+from .audio import SAMPLE_RATE
+
+_SILENCE_RE = re.compile(rb"silence_(?P<kind>start|end):\s*(?P<t>[0-9.]+)")
+_READ_CHUNK_BYTES = 64 * 1024
+
+
+def _iter_silence_events(stream: IO[bytes]) -> Iterator[tuple[bytes, float]]:
+    # Scan fixed-size blocks with one finditer each; only the trailing partial line is carried
+    # over, so memory stays bounded however long ffmpeg logs.
+    tail = b""
+    while True:
+        block = stream.read(_READ_CHUNK_BYTES)
+        if not block:
+            break
+        buffer = tail + block
+        cut = buffer.rfind(b"\n") + 1
+        tail = buffer[cut:]
+        for match in _SILENCE_RE.finditer(buffer, 0, cut):
+            yield match.group("kind"), float(match.group("t"))
+    for match in _SILENCE_RE.finditer(tail):
+        yield match.group("kind"), float(match.group("t"))
+
+
+def _feed_pcm(stream: IO[bytes], pcm: np.ndarray) -> None:
+    try:
+        stream.write(memoryview(np.ascontiguousarray(pcm)).cast("B"))
+    except BrokenPipeError:
+        pass
+    finally:
+        try:
+            stream.close()
+        except BrokenPipeError:
+            pass
 
 
 def detect_silence_regions(
-    video_path: str,
+    video_path: str | None = None,
     ffmpeg_bin: str = "ffmpeg",
     noise_threshold: str = "-30dB",
     min_duration_sec: float = 0.3,
+    pcm: np.ndarray | None = None,
 ) -> list[dict[str, float]]:
+    if pcm is None and video_path is None:
+        raise ValueError("either video_path or pcm is required")
+
+    if pcm is not None:
+        input_args = ["-f", "s16le", "-ar", str(SAMPLE_RATE), "-ac", "1", "-i", "-"]
+    else:
+        input_args = ["-i", video_path]
+
     cmd = [
         ffmpeg_bin,
         "-hide_banner",
-        "-i",
-        video_path,
+        "-nostats",
+        *input_args,
         "-af",
         f"silencedetect=noise={noise_threshold}:d={min_duration_sec}",
         "-f",
@@ -26,27 +70,35 @@ def detect_silence_regions(
         "-",
     ]
 
-    process = subprocess.run(cmd, capture_output=True, text=True, check=False)
-    output = process.stderr or ""
+    process = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE if pcm is not None else subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    # stdin is fed from a separate thread so a full stderr pipe can never stall the writer.
+    feeder: threading.Thread | None = None
+    if pcm is not None and process.stdin is not None:
+        feeder = threading.Thread(target=_feed_pcm, args=(process.stdin, pcm), daemon=True)
+        feeder.start()
+
     regions: list[dict[str, float]] = []
     current_start: float | None = None
 
-    for line in output.splitlines():
-        start_match = _START_RE.search(line)
-        if start_match:
-            current_start = float(start_match.group(1))
+    assert process.stderr is not None
+    for kind, value in _iter_silence_events(process.stderr):
+        if kind == b"start":
+            current_start = value
             continue
 
-        end_match = _END_RE.search(line)
-        if end_match and current_start is not None:
-            end_sec = float(end_match.group(1))
+        if current_start is not None:
+            end_sec = value
             if end_sec > current_start:
-                regions.append(
-                    {
-                        "startSec": round(current_start, 3),
-                        "endSec": round(end_sec, 3),
-                    }
-                )
+                regions.append({"startSec": current_start, "endSec": end_sec})
             current_start = None
 
-    return regions
\ No newline at end of file
+    if feeder is not None:
+        feeder.join()
+    process.wait()
+
+    return regions
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import importlib.util
+
+WHISPERCPP_REPO = "ggerganov/whisper.cpp"
+# ggerganov/whisper.cpp ships q5_1 files for tiny/base/small (and their .en variants) but only
+# q5_0 for medium, medium.en and the large-v2/v3/v3-turbo models.
+_Q5_0_PREFIXES = ("medium", "large")
+
+MISSING_BINDING_MESSAGE = (
+    "The whispercpp backend requires pywhispercpp; "
+    "install it with `pip install -r services/ai/requirements-whispercpp.txt`"
+)
+
+
+def binding_available() -> bool:
+    return importlib.util.find_spec("pywhispercpp") is not None
+
+
+def model_quant(model_name: str) -> str:
+    return "q5_0" if model_name.startswith(_Q5_0_PREFIXES) else "q5_1"
+
+
+def model_filename(model_name: str) -> str:
+    return f"ggml-{model_name}-{model_quant(model_name)}.bin"
+
+
+def fetch_model(model_name: str, model_dir: str, local_files_only: bool = False) -> str:
+    from huggingface_hub import hf_hub_download
+
+    return hf_hub_download(
+        WHISPERCPP_REPO,
+        model_filename(model_name),
+        cache_dir=model_dir,
+        local_files_only=local_files_only,
+    )